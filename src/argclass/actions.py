@@ -5,8 +5,13 @@ from .core import Arg
 
 __all__ = ['AliasArg', 'MappingArg']
 
+# keywords of the main option that are dropped or replaced for its aliases
+_ALIAS_OVERWRITE_KEYS = frozenset(['metavar', 'type', 'action', 'const', 'help'])
+
 
 class AliasArg(Arg):
+    __slots__ = ('aliases',)
+
     def __init__(self, *options,
                  aliases: dict[str, Any],
                  **kwargs):
@@ -25,14 +30,13 @@ class AliasArg(Arg):
             raise RuntimeError(f'{name}.{self.attr} : ' + repr(e)) from e
 
         owner = self.options[0]
+        kw = {k: v for k, v in self.kwargs.items() if k not in _ALIAS_OVERWRITE_KEYS}
         for name, values in self.aliases.items():
-            kw = dict(self.kwargs)
-            kw.pop('metavar', None)
-            kw.pop('type', None)
-            kw['action'] = 'store_const'
-            kw['const'] = values
-            kw['help'] = f'short for {owner}={values}.'
-            ap.add_argument(name, **kw, dest=self.attr)
+            ap.add_argument(name, **kw,
+                            action='store_const',
+                            const=values,
+                            help=f'short for {owner}={values}.',
+                            dest=self.attr)
 
 
 class MappingArgAction(argparse.Action):
@@ -47,6 +51,14 @@ class MappingArgAction(argparse.Action):
         self._type = type
         self._choice = choices
 
+        # pick the per-value conversion once, instead of testing choices/type on every value
+        if choices is not None:
+            self._value = self._checked_value if type is None else self._checked_typed_value
+        elif type is not None:
+            self._value = self._typed_value
+        else:
+            self._value = None
+
         if metavar is None:
             if choices is None:
                 metavar = 'KEY=VALUE'
@@ -67,27 +79,32 @@ class MappingArgAction(argparse.Action):
                  namespace: argparse.Namespace,
                  values: str,
                  option_string: str | None = None) -> None:
-        coll = getattr(namespace, self.dest, {})
-        if coll is None:
-            coll = {}
-
-        value = values[0]
-        if '=' in value:
-            k, v = value.split('=', 2)
-        else:
-            k = value
-            v = ''
+        # dest starts as the default={} given to argparse.Action above, one dict shared by every parse.
+        # start a new dict for the first value instead of filling that one.
+        coll = namespace.__dict__.get(self.dest) or {}
 
-        if self._choice is not None and v not in self._choice:
-            raise ValueError(f'{k}={v} not in choice: {self._choice}')
+        k, _, v = values[0].partition('=')
 
-        if self._type is not None:
-            v = self._type(v)
+        if self._value is not None:
+            v = self._value(k, v)
 
         coll[k] = v
         setattr(namespace, self.dest, coll)
 
+    def _typed_value(self, k: str, v: str):
+        return self._type(v)
+
+    def _checked_value(self, k: str, v: str):
+        if v not in self._choice:
+            raise ValueError(f'{k}={v} not in choice: {self._choice}')
+        return v
+
+    def _checked_typed_value(self, k: str, v: str):
+        return self._type(self._checked_value(k, v))
+
 
 class MappingArg(Arg):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, action=MappingArgAction, **kwargs)
@@ -1,11 +1,15 @@
 import abc
 import argparse
-import collections
+import copy
+import functools
 import sys
 from collections.abc import Iterable, Sequence, Callable
 from typing import Any, TypeVar, Literal, overload, get_origin, get_args, get_type_hints, Type
 
-from typing_extensions import Self
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
 
 from .validator import bool_type, ann_type
 
@@ -43,6 +47,12 @@ Actions = Literal[
     'boolean'
 ]
 
+_SUPPRESS = argparse.SUPPRESS
+_RawTextHelpFormatter = argparse.RawTextHelpFormatter
+
+_VALUE_ACTIONS = frozenset(['store', 'store_const'])
+_COLLECTION_ACTIONS = frozenset(['append', 'append_const', 'extend'])
+
 
 class ArgumentParser(argparse.ArgumentParser):
     exit_status: int | None = None
@@ -57,6 +67,47 @@ class ArgumentParser(argparse.ArgumentParser):
         self.exit_message = message
 
 
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """Sub-commands action which builds the parser of a command only when that command is chosen."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_parsers: dict[str, tuple[Any, bool]] = {}
+
+    def add_lazy_parser(self, cmd: str, opt: T | type[T], reset=False):
+        """Register *cmd* with an empty parser, which is filled by :func:`new_parser` on first use.
+
+        :param cmd: command name
+        :param opt: options instance or class of the command
+        :param reset: reset *opt*'s argument values when its parser is built.
+        """
+        self.add_parser(cmd, help=opt.__doc__, add_help=False)
+        self._lazy_parsers[cmd] = (opt, reset)
+
+    def build_parser(self, cmd: str) -> ArgumentParser:
+        """Fill the parser of *cmd* now, if it is not filled yet.
+
+        :param cmd: command name
+        :return: parser of *cmd*
+        """
+        sub = self._name_parser_map[cmd]
+        if (lazy := self._lazy_parsers.pop(cmd, None)) is not None:
+            opt, reset = lazy
+            ppap = new_parser(opt, reset=reset)
+            ppap.set_defaults(main=opt)
+
+            # same as ArgumentParser(parents=[ppap])
+            sub._add_container_actions(ppap)
+            sub._defaults.update(ppap._defaults)
+        return sub
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        if values[0] in self._lazy_parsers:
+            self.build_parser(values[0])
+
+        super().__call__(parser, namespace, values, option_string)
+
+
 class AbstractOptions(metaclass=abc.ABCMeta):
     """Abstract Option class.
 
@@ -82,12 +133,13 @@ class AbstractOptions(metaclass=abc.ABCMeta):
         :param system_exit: raise SystemExit when return code is non-zero (include parsing error).
         :return:
         """
-        ap = self.new_parser(reset=True)
+        # per-call copy, so nested or concurrent calls do not overwrite each other's exit status
+        ap = copy.copy(_main_parser(type(self)))
         res = ap.parse_args(args)
         set_options(self, res)
 
         if parse_only:
-            return ap.exit_status
+            return 0 if ap.exit_status is None else ap.exit_status
 
         if ap.exit_status is not None and system_exit:
             if system_exit is True:
@@ -106,7 +158,7 @@ class AbstractOptions(metaclass=abc.ABCMeta):
             if system_exit is True:
                 sys.exit(ret)
             else:
-                raise system_exit(ap.exit_status)
+                raise system_exit(ret)
 
         return ret
 
@@ -128,17 +180,15 @@ class AbstractOptions(metaclass=abc.ABCMeta):
 
     @classmethod
     def print_help(cls, **kwargs) -> str:
-        from io import StringIO
-        buf = StringIO()
-        cls.new_parser(**kwargs).print_help(file=buf)
-        return buf.getvalue()
+        if not _is_hashable(kwargs):
+            return cls.new_parser(**kwargs).format_help()
+        return _help_text(cls, **kwargs)
 
     @classmethod
     def print_usage(cls, **kwargs) -> str:
-        from io import StringIO
-        buf = StringIO()
-        cls.new_parser(**kwargs).print_usage(file=buf)
-        return buf.getvalue()
+        if not _is_hashable(kwargs):
+            return cls.new_parser(**kwargs).format_usage()
+        return _usage_text(cls, **kwargs)
 
     def __str__(self):
         return type(self).__name__
@@ -147,24 +197,21 @@ class AbstractOptions(metaclass=abc.ABCMeta):
         """key value pair content"""
         self_type = type(self)
         ret = []
-        for a_name in dir(self_type):
-            a_value = getattr(self_type, a_name)
-            if isinstance(a_value, Arg) and not a_name.startswith('_'):
-                try:
-                    ret.append(f'{a_name} = {a_value.__get__(self, self_type)}')
-                except:
-                    ret.append(f'{a_name} = <error>')
-            elif isinstance(a_value, property):
-                try:
-                    ret.append(f'{a_name} = {a_value.__get__(self, self_type)}')
-                except:
-                    ret.append(f'{a_name} = <error>')
+        for a_name, a_value in _repr_members(self_type):
+            try:
+                ret.append(f'{a_name} = {a_value.__get__(self, self_type)}')
+            except:
+                ret.append(f'{a_name} = <error>')
 
         return '\n'.join(ret)
 
 
 class Arg(object):
     __match_args__ = ()
+    __slots__ = (
+        'attr', '_slot', 'attr_type', 'group', 'ex_group', 'validator', 'options', 'hidden', 'kwargs',
+        '_caster', '_default', '_const',
+    )
 
     def __init__(self, *options,
                  validator: Callable[[T], bool] = None,
@@ -173,37 +220,34 @@ class Arg(object):
                  hidden: bool = False,
                  **kwargs):
         self.attr = None
+        self._slot = None
         self.attr_type = Any
         self.group = group
         self.ex_group = ex_group
         self.validator = validator
-        self.options = options
+        self.options = tuple([sys.intern(it) if isinstance(it, str) else it for it in options])
         self.hidden = hidden
         self.kwargs = kwargs
+        self._caster = kwargs.get('type', None)
+        self._resolve_constants()
 
     @property
     def default(self) -> Any:
-        try:
-            return self.kwargs['default']
-        except KeyError:
-            pass
-
-        if self.attr_type == bool:
-            return self.kwargs.get('action', 'store_true') != 'store_true'
-
-        return missing
+        return self._default
 
     @property
     def const(self) -> Any:
-        try:
-            return self.kwargs['const']
-        except KeyError:
-            pass
+        return self._const
 
-        if self.attr_type == bool:
-            return self.kwargs.get('action', 'store_true') == 'store_true'
+    def _resolve_constants(self):
+        """Resolve :attr:`default` and :attr:`const` from the keywords and the annotation type."""
+        if (default := self.kwargs.get('default', missing)) is missing and self.attr_type == bool:
+            default = self.kwargs.get('action', 'store_true') != 'store_true'
+        self._default = default
 
-        return missing
+        if (const := self.kwargs.get('const', missing)) is missing and self.attr_type == bool:
+            const = self.kwargs.get('action', 'store_true') == 'store_true'
+        self._const = const
 
     @property
     def metavar(self) -> str | None:
@@ -219,25 +263,11 @@ class Arg(object):
 
     @property
     def type(self) -> type | Callable[[str], T]:
-        try:
-            return self.kwargs['type']
-        except KeyError:
-            pass
-
-        attr_type = self.attr_type
-        if attr_type == bool:
-            return bool_type
-        elif attr_type in (str, int, float):
-            return attr_type
-        else:
-            return ann_type(self.attr, attr_type)
+        return self._caster
 
     def cast(self, value: str) -> T:
-        ret = self.type(value)
-        if self.validator is not None:
-            if not self.validator(ret):
-                raise ValueError(value)
-        return ret
+        # validator, if any, is already combined into kwargs['type'] by __set_name__
+        return self._caster(value)
 
     @property
     def help(self) -> str | None:
@@ -245,7 +275,13 @@ class Arg(object):
 
     def __set_name__(self, owner: type, name: str):
         self.attr = name
-        self.attr_type = get_type_hints(owner).get(name, Any)
+        self._slot = sys.intern(f'__{name}')  # instance __dict__ key
+        if any(name in getattr(clz, '__annotations__', ()) for clz in owner.__mro__):
+            self.attr_type = _cached_type_hints(owner).get(name, Any)
+        else:  # not annotated, avoid resolving the (forward referenced) hints of other attributes
+            self.attr_type = Any
+        origin = get_origin(self.attr_type)
+        type_args = get_args(self.attr_type)
 
         if len(self.options) == 0:  # positional argument
             if 'default' not in self.kwargs:
@@ -259,54 +295,63 @@ class Arg(object):
                 else:
                     self.kwargs.setdefault('action', 'store_true')
 
-            if get_origin(self.attr_type) is list:
+            if origin is list:
                 self.kwargs.setdefault('action', 'append')
             else:
                 self.kwargs.setdefault('action', 'store')
 
-            if self.kwargs['action'] in ('store', 'store_const'):  # value type
+            if (action := self.kwargs['action']) in _VALUE_ACTIONS:  # value type
                 self.kwargs['type'] = ann_type(self.attr, self.attr_type)
-                if get_origin(self.attr_type) == Literal and 'metavar' not in self.kwargs:
-                    self.kwargs['metavar'] = '|'.join(get_args(self.attr_type))
-            elif self.kwargs['action'] in ('append', 'append_const', 'extend'):  # collection type
-                self.kwargs.setdefault('default', get_origin(self.attr_type)())
+                if origin == Literal and 'metavar' not in self.kwargs:
+                    self.kwargs['metavar'] = '|'.join(type_args)
+            elif action in _COLLECTION_ACTIONS:  # collection type
+                self.kwargs.setdefault('default', origin())
 
-                a_type_arg = get_args(self.attr_type)  # Coll[T]
-                if len(a_type_arg) == 0:
+                # Coll[T]
+                if len(type_args) == 0:
                     self.kwargs['type'] = self.attr_type
-                elif len(a_type_arg) == 1:
-                    self.kwargs['type'] = ann_type(self.attr, a_type_arg[0])
+                elif len(type_args) == 1:
+                    self.kwargs['type'] = ann_type(self.attr, type_args[0])
                 else:
                     raise RuntimeError()
 
-        if 'choices' not in self.kwargs and get_origin(self.attr_type) == Literal:
-            self.kwargs['choices'] = get_args(self.attr_type)
+        if 'choices' not in self.kwargs and origin == Literal:
+            self.kwargs['choices'] = type_args
 
         if self.validator is not None:
-            self.kwargs['type'] = validator(self.kwargs['type'], self.validator)
+            # keywords copied by with_options() or set_default() already carry the validated caster
+            if getattr(caster := self.kwargs['type'], '_validator', None) is not self.validator:
+                self.kwargs['type'] = validator(caster, self.validator)
 
         if self.hidden:
-            self.kwargs['help'] = argparse.SUPPRESS
+            self.kwargs['help'] = _SUPPRESS
+
+        self._resolve_constants()
+
+        # caster of cast(), resolved once as neither the keywords nor the annotation change afterward.
+        if 'type' in self.kwargs:
+            self._caster = self.kwargs['type']
+        elif self.attr_type == bool:
+            self._caster = bool_type
+        elif self.attr_type in (str, int, float):
+            self._caster = self.attr_type
+        else:
+            self._caster = ann_type(name, self.attr_type)
 
     def __get__(self, instance, owner=None):
         if instance is None:
             return self
 
         try:
-            return instance.__dict__[f'__{self.attr}']
+            return instance.__dict__[self._slot]
         except KeyError:
-            pass
-
-        raise AttributeError
+            raise AttributeError(self.attr) from None
 
     def __set__(self, instance, value):
-        instance.__dict__[f'__{self.attr}'] = value
+        instance.__dict__[self._slot] = value
 
     def __delete__(self, instance):
-        try:
-            del instance.__dict__[f'__{self.attr}']
-        except KeyError:
-            pass
+        instance.__dict__.pop(self._slot, None)
 
     def add_argument(self, ap: argparse._ActionsContainer, owner):
         try:
@@ -329,18 +374,11 @@ class Arg(object):
         :param omit_value: value used when value is omitted.
         :return:
         """
-        kwargs = dict(self.kwargs)
         if omit_value is missing:
-            kwargs['default'] = value
-            kwargs['nargs'] = 1
-            try:
-                del kwargs['const']
-            except KeyError:
-                pass
+            kwargs = {**self.kwargs, 'default': value, 'nargs': 1}
+            kwargs.pop('const', None)
         else:
-            kwargs['default'] = value
-            kwargs['const'] = omit_value
-            kwargs['nargs'] = '?'
+            kwargs = {**self.kwargs, 'default': value, 'const': omit_value, 'nargs': '?'}
 
         return Arg(
             *self.options,
@@ -388,50 +426,36 @@ class Arg(object):
         :param kwargs: change keyword parameters, use `...` to unset parameter
         :return:
         """
-        kw = dict(self.kwargs)
-        kw['group'] = self.group
-        kw['ex_group'] = self.ex_group
-        kw['validator'] = self.validator
-        kw['hidden'] = self.hidden
-        kw.update(kwargs)
-
-        for k in list(kw.keys()):
-            if kw[k] is ...:
-                del kw[k]
+        kw = {
+            k: v
+            for k, v in {
+                **self.kwargs,
+                'group': self.group,
+                'ex_group': self.ex_group,
+                'validator': self.validator,
+                'hidden': self.hidden,
+                **kwargs
+            }.items()
+            if v is not ...
+        }
 
         cls = type(self)
 
         if len(self.options) > 0:
-            match options:
-                case ():
-                    return cls(*self.options, **kw)
-                case (a, *o) if a is ...:
-                    return cls(*self.options, *o, **kw)
-                case (dict(mapping), ):
-                    return cls(*self._map_options(mapping, False), **kw)
-                case (dict(mapping), a) if a is ...:
-                    return cls(*self._map_options(mapping, True), **kw)
-                case (dict(mapping), a, *o) if a is ...:
-                    return cls(*self._map_options(mapping, True), *o, **kw)
-                case (dict(mapping), *o):
-                    return cls(*self._map_options(mapping, False), *o, **kw)
-                case _:
-                    return cls(*options, **kw)
-            # if len(options) == 0:
-            #     return cls(*self.options, **kw)
-            # elif options[0] is ...:
-            #     return cls(*self.options, *options[1:], **kw)
-            # elif isinstance(options[0], dict):
-            #     if len(options) == 1:
-            #         return cls(*self._map_options(options[0], False), **kw)
-            #     if len(options) == 2 and options[1] is ...:
-            #         return cls(*self._map_options(options[0], True), **kw)
-            #     if options[1] is ...:
-            #         return cls(*self._map_options(options[0], True), *options[2:], **kw)
-            #     else:
-            #         return cls(*self._map_options(options[0], False), *options[1:], **kw)
-            # else:
-            #     return cls(*options, **kw)
+            if len(options) == 0:
+                return cls(*self.options, **kw)
+
+            # (dict?, ...?, *str)
+            i = 1 if (is_mapping := isinstance(options[0], dict)) else 0
+            keep = len(options) > i and options[i] is ...
+            if is_mapping:
+                head = self._map_options(options[0], keep)
+            elif keep:
+                head = self.options
+            else:
+                head = ()
+
+            return cls(*head, *options[i + keep:], **kw)
 
         else:
             if len(options) > 0:
@@ -450,6 +474,39 @@ class Arg(object):
         return new_opt
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_type_hints(owner: type) -> dict[str, Any]:
+    """resolved type hints of *owner*."""
+    return get_type_hints(owner)
+
+
+@functools.lru_cache(maxsize=None)
+def _main_parser(opt_type: type[AbstractOptions]) -> ArgumentParser:
+    """parser template of :meth:`AbstractOptions.main`."""
+    return opt_type.new_parser()
+
+
+def _is_hashable(kwargs: dict[str, Any]) -> bool:
+    """whether *kwargs* could be used as a cache key."""
+    try:
+        hash(tuple(kwargs.values()))
+    except TypeError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _help_text(opt_type: type[AbstractOptions], **kwargs) -> str:
+    """help text of *opt_type*, at the terminal width of its first format."""
+    return opt_type.new_parser(**kwargs).format_help()
+
+
+@functools.lru_cache(maxsize=None)
+def _usage_text(opt_type: type[AbstractOptions], **kwargs) -> str:
+    """usage text of *opt_type*."""
+    return opt_type.new_parser(**kwargs).format_usage()
+
+
 def validator(type_caster: Callable[[str], T], validator: Callable[[T], bool]) -> T:
     """validator combined type caster.
 
@@ -464,22 +521,65 @@ def validator(type_caster: Callable[[str], T], validator: Callable[[T], bool]) -
             raise ValueError(value)
         return ret
 
+    _type._validator = validator
     return _type
 
 
+@functools.lru_cache(maxsize=None)
+def _args_of(clazz: type) -> tuple[Arg, ...]:
+    """annotated :class:`Arg` of *clazz*."""
+    # keep the position of first annotation, while getattr resolves the overwritten Arg
+    ret: dict[str, Arg] = {}
+    for clz in reversed(clazz.mro()):
+        for attr in getattr(clz, '__annotations__', ()):
+            if isinstance((arg := getattr(clazz, attr, None)), Arg):
+                ret[attr] = arg
+    return tuple(ret.values())
+
+
+@functools.lru_cache(maxsize=None)
+def _repr_members(clazz: type) -> tuple[tuple[str, Any], ...]:
+    """public :class:`Arg` and all properties of *clazz*, sorted by name as :func:`dir` does."""
+    members = {}
+    for clz in reversed(clazz.mro()):
+        members.update(vars(clz))
+
+    return tuple(sorted(
+        (a_name, a_value)
+        for a_name, a_value in members.items()
+        if (isinstance(a_value, Arg) and not a_name.startswith('_')) or isinstance(a_value, property)
+    ))
+
+
 def foreach_arguments(opt: T | type[T]) -> Iterable[Arg]:
+    """annotated :class:`Arg` of *opt*.
+
+    Arguments, annotations and defaults are cached per class on first use,
+    so changes patched onto the class afterward are not seen.
+    """
     if isinstance(opt, type):
         clazz = opt
     else:
         clazz = type(opt)
 
-    arg_set = set()
-    for clz in reversed(clazz.mro()):
-        if (ann := getattr(clz, '__annotations__', None)) is not None:
-            for attr in ann:
-                if isinstance((arg := getattr(clazz, attr, None)), Arg) and attr not in arg_set:
-                    arg_set.add(attr)
-                    yield arg
+    yield from _args_of(clazz)
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_layout(opt_type: type, group_order: tuple[str, ...]) -> tuple[tuple[str | None, tuple[Arg, ...]], ...]:
+    """Arguments of *opt_type* grouped in the order they are added into the parser.
+
+    :param opt_type: options class
+    :param group_order: group names which are added first, in the given order.
+    :return: tuple of (group name, arguments). ``None`` group for ungrouped arguments, which always comes first.
+    """
+    gp: dict[str | None, list[Arg]] = {None: []}
+    for arg in _args_of(opt_type):
+        gp.setdefault(arg.group, []).append(arg)
+
+    # ungrouped arguments, ordered groups, then left groups in the order they first appear.
+    order = dict.fromkeys([None, *(group for group in group_order if group in gp), *gp])
+    return tuple((group, tuple(gp[group])) for group in order)
 
 
 def new_parser(opt: T | type[T], reset=False,
@@ -492,7 +592,7 @@ def new_parser(opt: T | type[T], reset=False,
     :param kwargs: keywords for ArgumentParser
     :return: ArgumentParser
     """
-    kwargs.setdefault('formatter_class', argparse.RawTextHelpFormatter)
+    kwargs.setdefault('formatter_class', _RawTextHelpFormatter)
 
     opt_type = opt if isinstance(opt, type) else type(opt)
 
@@ -512,46 +612,23 @@ def new_parser(opt: T | type[T], reset=False,
 
     ap = ArgumentParser(**kwargs)
 
-    gp: dict[str, list[Arg]] = collections.defaultdict(list)
-    eg: dict[tuple[str | None, str], argparse._ActionsContainer] = {}
-
-    #
-    for arg in foreach_arguments(opt):
-        if not isinstance(opt, type) and reset:
+    if reset and not isinstance(opt, type):
+        for arg in foreach_arguments(opt):
             arg.__delete__(opt)
 
-        if arg.group is not None:
-            gp[arg.group].append(arg)
-            continue
-        elif arg.ex_group is not None:
-            try:
-                tp = eg[(None, arg.ex_group)]
-            except KeyError:
-                eg[(None, arg.ex_group)] = tp = ap.add_mutually_exclusive_group()
-        else:
-            tp = ap
-
-        arg.add_argument(tp, opt)
+    eg: dict[tuple[str | None, str], argparse._ActionsContainer] = {}
 
-    # group arguments, for ordered groups
-    for group in (group_order_list or []):
-        if (args := gp.pop(group, None)) is not None:
-            pp = ap.add_argument_group(group)
-            for arg in args:
+    for group, args in _parser_layout(opt_type, tuple(group_order_list or ())):
+        pp = ap if group is None else ap.add_argument_group(group)
+        for arg in args:
+            if arg.ex_group is None:
                 tp = pp
+            else:
+                try:
+                    tp = eg[(group, arg.ex_group)]
+                except KeyError:
+                    eg[(group, arg.ex_group)] = tp = pp.add_mutually_exclusive_group()
 
-                if arg.ex_group is not None:
-                    try:
-                        tp = eg[(group, arg.ex_group)]
-                    except KeyError:
-                        eg[(group, arg.ex_group)] = tp = tp.add_mutually_exclusive_group()
-
-                arg.add_argument(tp, opt)
-
-    # group arguments, for left groups
-    for group, args in gp.items():
-        tp = ap.add_argument_group(group)
-        for arg in args:
             arg.add_argument(tp, opt)
 
     return ap
@@ -560,34 +637,56 @@ def new_parser(opt: T | type[T], reset=False,
 def new_command_parser(parsers: dict[str, AbstractOptions | type[AbstractOptions]],
                        usage: str = None,
                        description: str = None,
-                       reset=False) -> ArgumentParser:
+                       reset=False,
+                       lazy=True) -> ArgumentParser:
+    """
+
+    :param parsers: command name to its options.
+    :param usage: usage of the main parser
+    :param description: description of the main parser
+    :param reset: reset options' argument values when their parser is built.
+    :param lazy: build a command's parser only when that command is parsed. Until then, its parser
+        in ``choices`` is empty, so ``format_help()`` on it shows no options, and the error of a badly
+        declared argument is raised only when the command is used. Use ``lazy=False`` to build all of
+        them here.
+    :return: ArgumentParser
+    """
     ap = ArgumentParser(
         usage=usage,
         description=description,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    sp = ap.add_subparsers()
+    sp: _LazySubParsersAction = ap.add_subparsers(action=_LazySubParsersAction)
 
     for cmd, pp in parsers.items():
-        ppap = new_parser(pp, reset=reset)
-        ppap.set_defaults(main=pp)
-        sp.add_parser(cmd, help=pp.__doc__, parents=[ppap], add_help=False)
+        sp.add_lazy_parser(cmd, pp, reset=reset)
+        if not lazy:
+            sp.build_parser(cmd)
 
     return ap
 
 
 def set_options(opt: T, res: argparse.Namespace):
+    # write argument values into the instance storage of Arg directly, bypassing Arg.__set__
+    ns = vars(res)
+    storage = opt.__dict__
     for arg in foreach_arguments(opt):
-        try:
-            value = getattr(res, arg.attr)
-        except AttributeError:
-            pass
-        else:
-            arg.__set__(opt, value)
+        if (value := ns.get(arg.attr, missing)) is not missing:
+            storage[arg._slot] = value
+
+
+@functools.lru_cache(maxsize=None)
+def _args_parser(opt_type: type) -> ArgumentParser:
+    """parser template of :func:`parse_args`, from :func:`new_parser` instead of the overridable classmethod."""
+    return new_parser(opt_type)
 
 
 def parse_args(opt: T, args: list[str] = None) -> T:
-    ap = new_parser(opt, reset=True)
+    for arg in foreach_arguments(opt):
+        arg.__delete__(opt)
+
+    # per-call copy, same as AbstractOptions.main
+    ap = copy.copy(_args_parser(type(opt)))
     res = ap.parse_args(args)
     set_options(opt, res)
     return opt
@@ -621,13 +720,27 @@ def print_help(opt: T):
     new_parser(opt).print_help(sys.stdout)
 
 
-def with_defaults(opt: T) -> T:
-    for arg in foreach_arguments(opt):
+@functools.lru_cache(maxsize=None)
+def _defaults_of(clazz: type) -> tuple[dict[str, Any], tuple[str, ...]]:
+    """default values of *clazz* arguments, and storage keys of arguments without default."""
+    values = {}
+    unset = []
+    for arg in _args_of(clazz):
         if (value := arg.default) is missing:
-            arg.__delete__(opt)
+            unset.append(arg._slot)
         else:
-            # print('set_default', arg.attr, value)
-            arg.__set__(opt, value)
+            values[arg._slot] = value
+    return values, tuple(unset)
+
+
+def with_defaults(opt: T) -> T:
+    values, unset = _defaults_of(type(opt))
+
+    storage = opt.__dict__
+    if storage:
+        for slot in unset:
+            storage.pop(slot, None)
+    storage.update(values)
 
     return opt
 
@@ -640,18 +753,27 @@ def copy_args(opt: T, ref: Any, **kwargs) -> T:
     :param kwargs: overwrite arguments
     :return: *opt*
     """
-    shadow = ShadowOption(ref, **kwargs)
-
+    storage = opt.__dict__
+    if not kwargs and type(ref) is type(opt):
+        # same options class, read values from the storage of *ref* instead of calling Arg.__get__.
+        source = ref.__dict__
+        for arg in foreach_arguments(opt):
+            if (value := source.get(arg._slot, missing)) is not missing:
+                storage[arg._slot] = arg.cast(value) if isinstance(value, str) else value
+        return opt
+
+    # same lookup as ShadowOption(ref, **kwargs), without its __getattr__ round trip per argument.
     for arg in foreach_arguments(opt):
-        try:
-            value = getattr(shadow, arg.attr)
-        except AttributeError:
-            pass
-        else:
-            if isinstance(value, str):
-                value = arg.cast(value)
-            # print('set', arg.attr, value)
-            arg.__set__(opt, value)
+        if (attr := arg.attr) in kwargs:
+            value = kwargs[attr]
+        elif attr.startswith('_') and attr[1:] in kwargs:
+            value = kwargs[attr[1:]]
+        elif (value := getattr(ref, attr, missing)) is missing:
+            continue
+
+        if isinstance(value, str):
+            value = arg.cast(value)
+        storage[arg._slot] = value
     return opt
 
 
@@ -688,12 +810,9 @@ def set_ext_options(opt: T, args: dict[str, Any | None],
 
 def as_dict(opt: T) -> dict[str, Any]:
     ret = {}
+    storage = opt.__dict__
     for arg in foreach_arguments(opt):
-        try:
-            value = arg.__get__(opt)
-        except AttributeError:
-            pass
-        else:
+        if (value := storage.get(arg._slot, missing)) is not missing:
             ret[arg.attr] = value
     return ret
 
@@ -704,16 +823,14 @@ class ShadowOption:
 
     def __init__(self, ref: Any, **kwargs):
         self.__ref = ref
-        self.__kwargs = kwargs
+        # keyword 'a' also overwrites the private attribute '_a', unless '_a' is given as well.
+        self.__kwargs = {f'_{k}': v for k, v in kwargs.items()} | kwargs
 
     def __getattr__(self, attr: str):
         if attr in self.__kwargs:
             return self.__kwargs[attr]
 
-        if attr.startswith('_') and attr[1:] in self.__kwargs:
-            return self.__kwargs[attr[1:]]
-
-        if hasattr(self.__ref, attr):
-            return getattr(self.__ref, attr)
+        if (value := getattr(self.__ref, attr, missing)) is not missing:
+            return value
 
         raise AttributeError(attr)
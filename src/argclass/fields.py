@@ -28,7 +28,7 @@ def arg(*options: str,
 
 
 def arg(*options: str, **kwargs):
-    if not all([it.startswith('-') for it in options]):
+    if not all(it.startswith('-') for it in options):
         raise RuntimeError(f'options should startswith "-". {options}')
     return Arg(*options, **kwargs)
 
@@ -89,7 +89,7 @@ def arg_mapping(*options: str,
 
 
 def arg_mapping(*options: str, **kwargs):
-    if not all([it.startswith('-') for it in options]):
+    if not all(it.startswith('-') for it in options):
         raise RuntimeError(f'options should startswith "-". {options}')
     return MappingArg(*options, **kwargs)
 
@@ -113,7 +113,7 @@ def arg_alias(*options: str,
 
 
 def arg_alias(*options: str, aliases: dict[str, Any], **kwargs):
-    if not all([it.startswith('-') for it in options]):
+    if not all(it.startswith('-') for it in options):
         raise RuntimeError(f'options should startswith "-". {options}')
     return AliasArg(*options, aliases=aliases, **kwargs)
 
@@ -1,4 +1,8 @@
-from collections.abc import Callable
+import functools
+import itertools
+import sys
+import types
+from collections.abc import Callable, Iterator
 from typing import TypeVar, get_origin, Any, Literal, get_args, Union, overload
 
 __all__ = [
@@ -13,11 +17,15 @@ __all__ = [
 
 T = TypeVar('T')
 
+# all case spellings of 'true' and 'false'
+_TRUE = frozenset(map(''.join, itertools.product(*zip('true', 'TRUE'))))
+_FALSE = frozenset(map(''.join, itertools.product(*zip('false', 'FALSE'))))
+
 
 def literal_value_type(arg: str):
-    if arg.upper() == 'TRUE':
+    if arg in _TRUE:
         return True
-    elif arg.upper() == 'FALSE':
+    elif arg in _FALSE:
         return False
     try:
         return int(arg)
@@ -31,17 +39,25 @@ def literal_value_type(arg: str):
 
 
 def literal_str_type(constant: tuple[str, ...]) -> Callable[[str], str]:
-    def _type(arg: str):
-        if arg in constant:
-            return arg
+    # every prefix of constants, to all constants it could be completed into.
+    # interned, so the result is likely the very object argparse finds in Literal choices.
+    found: dict[str, list[str]] = {}
+    for it in constant:
+        if isinstance(it, str):
+            it = sys.intern(it)
+            for i in range(len(it) + 1):
+                found.setdefault(sys.intern(it[:i]), []).append(it)
+
+    complete = {prefix: it[0] for prefix, it in found.items() if len(it) == 1}
+    complete.update({sys.intern(it): sys.intern(it) for it in constant if isinstance(it, str)})  # exact match first
 
-        found = [it for it in constant if it.startswith(arg)]
-        if len(found) == 1:
-            return found[0]
-        elif len(found) == 0:
-            raise ValueError(f'unknown "{arg}". should one of {str(constant)}')
+    def _type(arg: str):
+        if (ret := complete.get(arg)) is not None:
+            return ret
+        elif arg in found:
+            raise ValueError(f'conflict "{arg}" between {str(found[arg])}')
         else:
-            raise ValueError(f'conflict "{arg}" between {str(found)}')
+            raise ValueError(f'unknown "{arg}". should one of {str(constant)}')
 
     return _type
 
@@ -53,27 +69,39 @@ def union_type(union_type_args):
     :return: type caster
     """
     none_type = type(None)
+    casters = tuple([it for it in union_type_args if it is not none_type])
+    if len(casters) == 1:  # Optional[T]
+        return casters[0]
 
     def _type(value: str):
-        for _a in union_type_args:
-            if _a is not none_type:
-                try:
-                    return _a(value)
-                except (TypeError, ValueError):
-                    pass
+        for _a in casters:
+            try:
+                return _a(value)
+            except (TypeError, ValueError):
+                pass
         raise ValueError
 
     return _type
 
 
+_BOOL_MAP = {
+    **dict.fromkeys(('-', '0', 'f', 'false', 'n', 'no', 'x'), False),
+    **dict.fromkeys(('', '+', '1', 't', 'true', 'yes', 'y'), True),
+}
+# common spellings, so they do not need lower()
+_BOOL_MAP.update({k.title(): v for k, v in _BOOL_MAP.items()})
+_BOOL_MAP.update({k.upper(): v for k, v in _BOOL_MAP.items()})
+
+
 def bool_type(value: str) -> bool:
-    value = value.lower()
-    if value in ('-', '0', 'f', 'false', 'n', 'no', 'x'):
-        return False
-    elif value in ('', '+', '1', 't', 'true', 'yes', 'y'):
-        return True
-    else:
-        raise ValueError()
+    try:
+        return _BOOL_MAP[value]
+    except KeyError:
+        pass
+    try:
+        return _BOOL_MAP[value.lower()]
+    except KeyError:
+        raise ValueError() from None
 
 
 def ann_type(a_name: str, a_type):
@@ -83,19 +111,40 @@ def ann_type(a_name: str, a_type):
     :param a_type: annotation type.
     :return: type caster.
     """
-    a_type_ori = get_origin(a_type)
-    if a_type == Any:
+    try:
+        # Union and Literal compare equal regardless of their arguments order, which matters for casting.
+        ret = _ann_type(a_type, get_args(a_type))
+    except TypeError:  # unhashable annotation
+        ret = _ann_type.__wrapped__(a_type, None)
+
+    if ret is _unknown:
+        raise RuntimeError(f'{a_name} {a_type}')
+    return ret
+
+
+_unknown = object()
+
+
+_ORIGIN_DISPATCH = {
+    Literal: literal_str_type,
+    Union: union_type,
+    types.UnionType: union_type,  # T1 | T2
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _ann_type(a_type, a_args):
+    if a_type is Any:
         return None
-    if a_type_ori == Literal:
-        return literal_str_type(get_args(a_type))
-    elif a_type_ori == Union:
-        return union_type(get_args(a_type))
+    a_type_ori = get_origin(a_type)
+    if (handler := _ORIGIN_DISPATCH.get(a_type_ori)) is not None:
+        return handler(get_args(a_type))
     elif a_type_ori is not None and (callable(a_type_ori) or isinstance(a_type_ori, type)):
         return a_type_ori
     elif callable(a_type) or isinstance(a_type, type):
         return a_type
     else:
-        raise RuntimeError(f'{a_name} {a_type}')
+        return _unknown
 
 
 @overload
@@ -118,11 +167,24 @@ def tuple_type(value_type=str, n: int = None, *, split=','):
     elif n is None:
         n = 0  # no-limited
 
-    def _cast(arg: str) -> tuple[T, ...]:
-        if callable(value_type):
-            return tuple(map(value_type, arg.split(split, maxsplit=(n - 1))))
-        else:
-            return tuple(map(lambda it: it[0](it[1]), zip(value_type, arg.split(split, maxsplit=(n - 1)))))
+    maxsplit = n - 1
+
+    if callable(value_type) and n == 2:  # unrolled common pairs
+        def _cast(arg: str) -> tuple[T, ...]:
+            if len(value := arg.split(split, 1)) == 2:
+                return value_type(value[0]), value_type(value[1])
+            return tuple(map(value_type, value))
+    elif callable(value_type) and n == 3:
+        def _cast(arg: str) -> tuple[T, ...]:
+            if len(value := arg.split(split, 2)) == 3:
+                return value_type(value[0]), value_type(value[1]), value_type(value[2])
+            return tuple(map(value_type, value))
+    elif callable(value_type):
+        def _cast(arg: str) -> tuple[T, ...]:
+            return tuple(map(value_type, arg.split(split, maxsplit)))
+    else:
+        def _cast(arg: str) -> tuple[T, ...]:
+            return tuple([t(v) for t, v in zip(value_type, arg.split(split, maxsplit))])
 
     return _cast
 
@@ -136,13 +198,17 @@ def list_type(value_type: Callable[[str], T] = str, *, split=',', prepend: list[
     :return: type caster.
     """
 
-    def _cast(arg: str) -> list[T]:
-        value = list(map(value_type, arg.split(split)))
+    if prepend is None:
+        def _cast(arg: str) -> list[T]:
+            return list(map(value_type, arg.split(split)))
+    else:
+        def _cast(arg: str) -> list[T]:
+            value = map(value_type, arg.split(split))
 
-        if arg.startswith('+') and prepend is not None:
-            return [*prepend, *value]
-        else:
-            return list(value)
+            if arg.startswith('+'):
+                return [*prepend, *value]
+            else:
+                return list(value)
 
     return _cast
 
@@ -156,65 +222,73 @@ def dict_type(value_type: Callable[[str], T] | dict[str, type | Callable[[str],
 
     :param value_type: type of dict value
     :param entry_sep: single character as entry seperator
-    :param kv_sep: single character candidates as key-value seperator
+    :param kv_sep: single character as key-value seperator
     :param prepend: default dict content
     :return: type converter
     """
     if prepend is None:
         prepend = {}
 
-    def _type(arg: str) -> dict[str, T]:
-        ret = dict(prepend)
+    if callable(value_type):
+        def _type(arg: str) -> dict[str, T]:
+            ret = dict(prepend)
+            for k, v in _dict_items(arg, entry_sep, kv_sep, quote):
+                ret[k] = value_type(v)
+            return ret
+    else:
+        default_type = value_type.get(..., str)
 
-        while len(arg):
-            k, v, arg = _dict_value(arg, entry_sep, kv_sep, quote)
-            if callable(value_type):
-                v = value_type(v)
-            else:
-                try:
-                    vf = value_type[k]
-                except KeyError:
-                    try:
-                        vf = value_type[...]
-                    except KeyError:
-                        vf = str
+        def _type(arg: str) -> dict[str, T]:
+            ret = dict(prepend)
+            for k, v in _dict_items(arg, entry_sep, kv_sep, quote):
+                ret[k] = value_type.get(k, default_type)(v)
+            return ret
 
-                v = vf(v)
-            ret[k] = v
+    return _type
 
-        return ret
 
-    return _type
+def _dict_items(expr: str, entry_sep: str, kv_sep: str, quote: str) -> Iterator[tuple[str, str]]:
+    if quote not in expr:  # no quoted value, split all entries at once.
+        entries = expr.split(entry_sep)
+        if len(entries[-1]) == 0:  # trailing entry_sep
+            del entries[-1]
+        for it in entries:
+            k, _, v = it.partition(kv_sep)
+            yield k, v
+    else:
+        pos = 0
+        end = len(expr)
+        while pos < end:
+            k, v, pos = _dict_entry(expr, pos, entry_sep, kv_sep, quote)
+            yield k, v
 
 
 def _dict_value(expr: str,
                 entry_sep: str = ',',
                 kv_sep: str = '=',
                 quote: str = '"') -> tuple[str, str, str]:
+    k, v, pos = _dict_entry(expr, 0, entry_sep, kv_sep, quote)
+    return k, v, expr[pos:]
+
+
+def _dict_entry(expr: str, pos: int,
+                entry_sep: str = ',',
+                kv_sep: str = '=',
+                quote: str = '"') -> tuple[str, str, int]:
+    """parse the entry at *pos* without slicing the remaining expression.
+
+    :return: tuple of key, value and the position of next entry.
+    """
     x = len(expr)
-    e = e if (e := expr.find(entry_sep)) >= 0 else x
-    k = k if (k := expr.find(kv_sep)) >= 0 else x
-    if k == e == x:
-        if x == 0:
-            return "", "", ""
-        else:
-            return expr, "", ""
-    elif k < e:  # KEY=...
-        r1 = expr[:k]
-        r2 = expr[k + 1:]
-        if len(r2) == 0:  # KEY=
-            return r1, "", ""
-        elif r2.startswith(quote):  # KEY="...
-            if (q := r2.find(quote, 1)) < 0:
-                raise ValueError(f'missing "{quote}" @ {r2}')
-            r3 = r2[q + 1:]
-            r2 = r2[1:q]
-            return r1, r2, r3
-        else:
-            r2 = expr[k + 1:e]
-            r3 = expr[e + 1:]
-            return r1, r2, r3
-    else:  # e < k # KEY,...
-        r1 = expr[:e]
-        r3 = expr[e + 1:]
-        return r1, "", r3
+    e = e if (e := expr.find(entry_sep, pos)) >= 0 else x
+    if (k := expr.find(kv_sep, pos, e)) < 0:  # KEY,...
+        return expr[pos:e], "", e + 1
+    elif k + 1 == x:  # KEY=
+        return expr[pos:k], "", x
+    elif expr.startswith(quote, k + 1):  # KEY="...
+        if (q := expr.find(quote, k + 2)) < 0:
+            raise ValueError(f'missing "{quote}" @ {expr[k + 1:]}')
+        n = q + 2 if expr.startswith(entry_sep, q + 1) else q + 1  # KEY="...",
+        return expr[pos:k], expr[k + 2:q], n
+    else:
+        return expr[pos:k], expr[k + 1:e], e + 1
@@ -1,7 +1,7 @@
 import unittest
 from typing import Any, Literal
 
-from argclass import arg, list_type, dict_type, tuple_type, as_arg, posarg, vararg
+from argclass import arg, list_type, dict_type, tuple_type, as_arg, posarg, vararg, arg_mapping
 from argclass.core import foreach_arguments, with_defaults, AbstractOptions, missing
 
 
@@ -153,6 +153,22 @@ class TestArgField(unittest.TestCase):
             C.a.cast('-1')
         self.assertEqual('-1', capture.exception.args[0])
 
+    def test_cast_with_validator_with_options(self):
+        checked = []
+
+        def check(it):
+            checked.append(it)
+            return it >= 0
+
+        class C:
+            a: int = arg('-a', validator=check)
+
+        class D(C):
+            a: int = as_arg(C.a).with_options(default=0)
+
+        self.assertEqual(1, D.a.cast('1'))
+        self.assertListEqual([1], checked)
+
 
 class TestArgType(unittest.TestCase):
     def test_bool_defaults(self):
@@ -475,6 +491,35 @@ class TestDictArgType(unittest.TestCase):
         self.assertDictEqual({'int': 1, 'float': 2.1, 'str': 'c', 'other': 'invalid'}, c.a)
 
 
+class TestMappingArgType(unittest.TestCase):
+    def test_parse_mapping(self):
+        class C(AbstractOptions):
+            a: dict[str, str] = arg_mapping('-a')
+
+            def run(self):
+                pass
+
+        c = C()
+        c.main(['-a', 'A=1', '-a', 'B', '-a', 'C=2=3'], parse_only=True)
+        self.assertDictEqual({'A': '1', 'B': '', 'C': '2=3'}, c.a)
+
+        # values of the previous parse are not left in the action's default dict
+        c = C()
+        c.main([], parse_only=True)
+        self.assertDictEqual({}, c.a)
+
+    def test_parse_mapping_type(self):
+        class C(AbstractOptions):
+            a: dict[str, int] = arg_mapping('-a', type=int)
+
+            def run(self):
+                pass
+
+        c = C()
+        c.main(['-a', 'A=1', '-a', 'B=2'], parse_only=True)
+        self.assertDictEqual({'A': 1, 'B': 2}, c.a)
+
+
 class TestPosArgType(unittest.TestCase):
     def test_pos_arg(self):
         class C(AbstractOptions):
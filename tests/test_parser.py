@@ -1,6 +1,10 @@
+import contextlib
+import io
+import sys
 import unittest
+from unittest import mock
 
-from argclass import AbstractOptions, arg
+from argclass import AbstractOptions, arg, new_command_parser, parse_command_args
 
 
 class C(AbstractOptions):
@@ -34,6 +38,29 @@ class TestParser(unittest.TestCase):
 
         self.assertEqual(10, e.exception.code)
 
+    def test_main_reenter(self):
+        c = C()
+        self.assertEqual(2, c.main(['-e'], parse_only=True))
+        self.assertFalse(c.main(['-a=1'], parse_only=True))
+        self.assertEqual(1, c.a)
+        self.assertFalse(c.main([], parse_only=True))
+        self.assertIsNone(c.a)
+
+    def test_main_nested(self):
+        class D(C):
+            nested = None
+
+            def run(self):
+                if self.a == 1:  # outer call, re-enter main() of the same class
+                    self.nested = D().main(['-a', 'bad'], parse_only=True)
+
+        d = D()
+        with self.assertRaises(RuntimeError) as e:
+            d.main(['-a', '1'], system_exit=RuntimeError)
+
+        self.assertEqual(2, d.nested)
+        self.assertEqual((0,), e.exception.args)
+
     def test_init_copy(self):
         c = C()
         c.main(['-a=10', '-b=10'], system_exit=False)
@@ -81,6 +108,87 @@ options:
 test
 """)
 
+    def test_group_ex_group(self):
+        class C(AbstractOptions):
+            a: int = arg('-a', group='G1', ex_group='X')
+            b: int = arg('-b', group='G1', ex_group='X')
+            c: int = arg('-c', group='G2', ex_group='Y')
+            d: int = arg('-d', group='G2', ex_group='Y')
+
+            def run(self):
+                pass
+
+        self.assertEqual(C.print_usage(prog='TEST'), """\
+usage: TEST [-h] [-a A | -b B] [-c C | -d D]
+""")
+        self.assertEqual(C.print_usage(prog='TEST', group_order_list=['G2']), """\
+usage: TEST [-h] [-c C | -d D] [-a A | -b B]
+""")
+
+        c = C()
+        self.assertEqual(2, c.main(['-c=1', '-d=2'], parse_only=True))
+
+
+class CommandA(AbstractOptions):
+    """command A"""
+    a: int = arg('-a', default=0)
+
+    def run(self):
+        pass
+
+
+class CommandB(AbstractOptions):
+    """command B"""
+    b: str = arg('-b')
+
+    def run(self):
+        pass
+
+
+class TestCommandParser(unittest.TestCase):
+    def test_parse_command(self):
+        opt = parse_command_args({'a': CommandA, 'b': CommandB}, ['a', '-a=2'], run_main=False)
+        self.assertIsInstance(opt, CommandA)
+        self.assertEqual(2, opt.a)
+
+        opt = parse_command_args({'a': CommandA, 'b': CommandB}, ['b', '-b=B'], run_main=False)
+        self.assertIsInstance(opt, CommandB)
+        self.assertEqual('B', opt.b)
+
+    def test_command_help(self):
+        ap = new_command_parser({'a': CommandA, 'b': CommandB})
+        ap.prog = 'TEST'
+        self.assertEqual(ap.format_help(), """\
+usage: TEST [-h] {a,b} ...
+
+positional arguments:
+  {a,b}
+    a         command A
+    b         command B
+
+options:
+  -h, --help  show this help message and exit
+""")
+
+    def test_command_sub_help(self):
+        out = io.StringIO()
+        with mock.patch.object(sys, 'argv', ['TEST']), contextlib.redirect_stdout(out):
+            opt = parse_command_args({'a': CommandA, 'b': CommandB}, ['b', '-h'], run_main=False)
+
+        self.assertIsInstance(opt, CommandB)
+        self.assertEqual(out.getvalue(), """\
+usage: TEST b [-h] [-b B]
+
+options:
+  -h, --help  show this help message and exit
+  -b B
+""")
+
+    def test_command_parser_not_lazy(self):
+        ap = new_command_parser({'a': CommandA, 'b': CommandB}, lazy=False)
+        sub = ap._subparsers._group_actions[0].choices['b']
+        self.assertIn('-b B', sub.format_help())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
+from typing import Optional, Union
 
-from argclass.validator import _dict_value
+from argclass.validator import _dict_value, literal_str_type, ann_type
 
 
 class DictTypeTest(unittest.TestCase):
@@ -13,6 +14,31 @@ class DictTypeTest(unittest.TestCase):
         self.assertEqual(("1", "a", "2=b"), _dict_value("1=a,2=b"))
         self.assertEqual(("1", "", ""), _dict_value("1="))
         self.assertEqual(("1", "", "2=b"), _dict_value("1=,2=b"))
+        self.assertEqual(("1", "a,b", ""), _dict_value('1="a,b"'))
+        self.assertEqual(("1", "a,b", "2=c"), _dict_value('1="a,b",2=c'))
+
+
+class LiteralTypeTest(unittest.TestCase):
+    def test_literal_str_type(self):
+        t = literal_str_type(('apple', 'apricot', 'a', 'banana'))
+        self.assertEqual('apple', t('apple'))
+        self.assertEqual('apple', t('app'))
+        self.assertEqual('a', t('a'))
+        self.assertEqual('banana', t('b'))
+        with self.assertRaises(ValueError) as capture:
+            t('ap')
+        self.assertEqual('conflict "ap" between [\'apple\', \'apricot\']', capture.exception.args[0])
+        with self.assertRaises(ValueError) as capture:
+            t('c')
+        self.assertTrue(capture.exception.args[0].startswith('unknown "c"'))
+
+
+class AnnTypeTest(unittest.TestCase):
+    def test_union_type(self):
+        self.assertIs(int, ann_type('a', Optional[int]))
+        self.assertIs(int, ann_type('a', int | None))
+        self.assertEqual(1, ann_type('a', int | str)('1'))
+        self.assertEqual('1', ann_type('a', Union[str, int])('1'))
 
 
 if __name__ == '__main__':